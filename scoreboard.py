@@ -1,5 +1,9 @@
-import inspect
-import queue
+import collections
+import html
+import logging
+import operator
+import os
+import reprlib
 import threading
 import time
 import sys # Import sys to write to stdout and stderr
@@ -18,9 +22,13 @@ class Transaction:
               or custom objects).
         timestamp (float): The time when the transaction occurred, in seconds
                            since the epoch. Defaults to the time of creation.
+                           Set the class-level CAPTURE_TIMESTAMP flag to False
+                           to skip the clock read and store 0.0 instead.
         line (int, optional): The line number in the source code where the
                               transaction was created. This is captured automatically
-                              and is useful for debugging.
+                              and is useful for debugging. Set the class-level
+                              CAPTURE_LINE flag to False to skip the frame walk
+                              entirely in performance-sensitive runs.
 
     Usage Examples:
         # For simple data
@@ -40,15 +48,129 @@ class Transaction:
         custom_txn_2 = CustomTransaction({"id": 1, "payload": "data2"})
         # custom_txn_1 == custom_txn_2 will be True due to the custom __eq__
     """
-    def __init__(self, data, timestamp=None):
+    # No per-instance __dict__; saves ~56 bytes per transaction and speeds
+    # up attribute access in the comparison hot path
+    __slots__ = ("data", "timestamp", "line", "_repr_cache")
+
+    # Payload types whose repr can be cached safely: immutable, so the
+    # rendered string can never go stale under the caller's feet
+    _CACHEABLE_TYPES = (int, float, str, bytes, tuple)
+
+    # Class-level freelist behind acquire()/release(). LIFO so the most
+    # recently released (cache-hot) instance is handed out first. Holds
+    # exact Transaction instances only; see release().
+    _pool = []
+    # High-watermark on idle freelist instances
+    _POOL_MAX = 1024
+
+    # Class-level switch for caller line-number capture. Disabling it skips
+    # the frame walk on every construction in performance-sensitive runs.
+    CAPTURE_LINE = True
+    # Class-level switch for creation-time capture. time.time() is a syscall;
+    # runs that never read timestamps can disable it.
+    CAPTURE_TIMESTAMP = True
+
+    def __init__(self, data, timestamp=None, _time=time.time):
+        # _time binds time.time at definition time, skipping the module
+        # attribute lookup on every construction
         self.data = data
-        self.timestamp = timestamp if timestamp is not None else time.time()
-        try:
-            # Get the frame of the caller to capture the line number
-            caller_frame = inspect.currentframe().f_back
-            self.line = caller_frame.f_lineno
-        except Exception:
+        if timestamp is not None:
+            self.timestamp = timestamp
+        else:
+            self.timestamp = _time() if self.CAPTURE_TIMESTAMP else 0.0
+        if self.CAPTURE_LINE:
+            try:
+                # sys._getframe is much cheaper than the inspect machinery
+                self.line = sys._getframe(1).f_lineno
+            except ValueError:
+                self.line = None
+        else:
             self.line = None
+        self._repr_cache = None
+
+    @classmethod
+    def from_interned(cls, data, timestamp=None):
+        """Creates a Transaction whose string payload is interned.
+
+        Interning identical actual/expected strings lets the equality fast
+        path retire on a pointer comparison instead of walking characters.
+        Non-string payloads are passed through unchanged.
+
+        Args:
+            data: The data content of the transaction.
+            timestamp (float, optional): Explicit timestamp; defaults to now.
+
+        Returns:
+            Transaction: A transaction wrapping the (possibly interned) data.
+        """
+        if type(data) is str:
+            data = sys.intern(data)
+        txn = cls(data, timestamp)
+        # Re-capture the line number from this call site, not this method
+        if cls.CAPTURE_LINE:
+            try:
+                txn.line = sys._getframe(1).f_lineno
+            except ValueError:
+                txn.line = None
+        return txn
+
+    @classmethod
+    def acquire(cls, data, timestamp=None, _time=time.time):
+        """Returns a Transaction wrapping data, reusing a freed instance
+        if one is available.
+
+        The class-level freelist caps steady-state allocations in
+        long-running testbenches: pair each acquire() with release() and
+        the allocator drops out of the hot path entirely. Unlike
+        TransactionPool there is no pool object to thread around, at the
+        cost of the freelist being shared process-wide. The class itself
+        satisfies the Scoreboard transaction_pool interface, so
+        Scoreboard(transaction_pool=Transaction) recycles every compared
+        transaction - matched or mismatched - back to this freelist
+        automatically; do not hold references to transactions after
+        writing them to such a scoreboard.
+
+        Args:
+            data: The data content for the transaction.
+            timestamp (float, optional): Explicit timestamp; defaults to now.
+
+        Returns:
+            Transaction: A recycled or freshly constructed instance.
+        """
+        pool = Transaction._pool
+        if cls is Transaction and pool:
+            txn = pool.pop()
+            txn.data = data
+            txn._repr_cache = None
+            if timestamp is not None:
+                txn.timestamp = timestamp
+            else:
+                txn.timestamp = _time() if cls.CAPTURE_TIMESTAMP else 0.0
+        else:
+            # Subclasses are never pooled, so they always construct fresh
+            txn = cls(data, timestamp)
+        # Re-capture the line number from this call site, not this method
+        if cls.CAPTURE_LINE:
+            try:
+                txn.line = sys._getframe(1).f_lineno
+            except ValueError:
+                txn.line = None
+        else:
+            txn.line = None
+        return txn
+
+    def release(self):
+        """Returns this instance to the class freelist for later reuse.
+
+        The data reference is dropped so the freelist does not keep
+        payloads alive. Subclass instances are silently not recycled,
+        since acquire() only re-initializes base attributes. The caller
+        must not touch the instance after releasing it.
+        """
+        if type(self) is Transaction and len(Transaction._pool) < self._POOL_MAX:
+            self.data = None
+            self._repr_cache = None
+            Transaction._pool.append(self)
 
     def __eq__(self, other):
         """Check if two Transaction instances are equal based on their data.
@@ -63,62 +185,478 @@ class Transaction:
         Returns:
             bool: True if the data attributes are equal, False otherwise.
         """
-        if not isinstance(other, Transaction):
-            return NotImplemented
-        # The default comparison is a deep equality check on the data.
-        # This works well for primitives, dicts, and lists.
-        return self.data == other.data
+        if self is other:
+            return True
+        if other.__class__ is not Transaction:
+            # Exact-type check is cheaper than isinstance, so it guards the
+            # fast path; subclasses that inherit this __eq__ still compare
+            # by data through the isinstance fallback, while subclasses
+            # defining their own __eq__ get the reflected operation
+            if not isinstance(other, Transaction):
+                return NotImplemented
+        a = self.data
+        b = other.data
+        # Identity short-circuits the deep equality check, which otherwise
+        # works well for primitives, dicts, and lists.
+        return a is b or a == b
+
+    # Defining __eq__ suppresses the inherited hash; spell it out so the
+    # unhashability is a documented decision rather than a side effect
+    __hash__ = None
 
     def __repr__(self):
         """Generate a string representation for debugging and reporting.
 
+        Large payloads are elided via reprlib so that logging a transaction
+        carrying a big list or dict stays O(1) instead of O(size). The
+        rendered string is cached for immutable payload types, since a
+        transaction is typically repr'd more than once (log line, mismatch
+        detail, HTML row) and none of its fields change in between.
+
         Returns:
             str: A formatted string with transaction details.
         """
-        return f"Transaction(data={self.data}, timestamp={self.timestamp:.4f}, line={self.line})"
+        cached = self._repr_cache
+        if cached is not None:
+            return cached
+        text = (f"Transaction(data={reprlib.repr(self.data)}, "
+                f"timestamp={self.timestamp:.4f}, line={self.line})")
+        if type(self.data) in self._CACHEABLE_TYPES:
+            self._repr_cache = text
+        return text
+
+def _html_mismatch_row(index, actual, expected, line, error):
+    """Renders a single mismatch as a pre-escaped HTML table row.
+
+    Args:
+        index (int): 1-based position of the mismatch in the report table.
+        actual: The actual transaction, or None for comparison errors.
+        expected: The expected transaction, or None for comparison errors.
+        line (int, optional): Producer line number, if captured.
+        error (str, optional): Error message for failed comparisons.
+
+    Returns:
+        str: A complete <tr> element for the mismatch table.
+    """
+    details = []
+    if error is not None:
+        details.append(f"<strong>Error:</strong> {html.escape(error)}<br>")
+    details.append(f"<strong>Actual:</strong> {html.escape(str(actual))}<br>")
+    details.append(f"<strong>Expected:</strong> {html.escape(str(expected))}<br>")
+    if line is not None:
+        details.append(f"<strong>Line:</strong> {line}")
+    return f"<tr><td>{index}</td><td>{''.join(details)}</td></tr>"
+
+
+def _compare_batch(actual_batch, expected_batch):
+    """Compares two equal-length batches of transactions element-wise.
+
+    map(operator.eq, ...) iterates at C level and dispatches each pair
+    straight to the rich-comparison slot, so the scoreboard's hottest loop
+    executes no per-pair Python bytecode.
+
+    Args:
+        actual_batch (list): Transactions received from the test environment.
+        expected_batch (list): Transactions from the reference model.
+
+    Returns:
+        list: One bool per pair, True where the transactions matched.
+    """
+    return list(map(operator.eq, actual_batch, expected_batch))
+
+
+class _SPSCRing:
+    """A lock-free single-producer single-consumer ring buffer.
+
+    Backed by a preallocated slot list with a power-of-two capacity so the
+    index wrap is a bit mask. The producer owns _tail and the consumer owns
+    _head; each is a plain int whose rebinding is atomic under the GIL, and
+    the slot is written before the tail is published, so push and pop never
+    need a lock. Safe for exactly one producer thread and one consumer
+    thread; anything else must go through the locked queues.
+    """
+
+    __slots__ = ("_slots", "_mask", "_head", "_tail")
+
+    def __init__(self, capacity):
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a positive power of two")
+        self._slots = [None] * capacity
+        self._mask = capacity - 1
+        # Next slot to read; written only by the consumer
+        self._head = 0
+        # Next slot to write; written only by the producer
+        self._tail = 0
+
+    def push(self, item):
+        """Appends an item; returns False without blocking if the ring is full."""
+        tail = self._tail
+        if tail - self._head > self._mask:
+            return False
+        self._slots[tail & self._mask] = item
+        # Publishing the new tail is the linearization point
+        self._tail = tail + 1
+        return True
+
+    def pop(self):
+        """Removes and returns the oldest item, or None if the ring is empty."""
+        head = self._head
+        if head == self._tail:
+            return None
+        index = head & self._mask
+        item = self._slots[index]
+        # Drop the slot reference so consumed items are not kept alive
+        self._slots[index] = None
+        self._head = head + 1
+        return item
+
+    def __len__(self):
+        return self._tail - self._head
+
+
+class TransactionPool:
+    """A bounded pool of reusable Transaction objects.
+
+    Constructing a Transaction allocates an object, reads the clock, and
+    walks a stack frame. Hot producer loops can avoid most of that churn by
+    acquiring recycled instances from a pool instead of constructing fresh
+    ones. Pass the pool to Scoreboard so every compared transaction -
+    matched or mismatched - is released back automatically: the report
+    stores pre-rendered detail strings, not object references, so nothing
+    keeps a compared transaction alive. Do not hold on to a transaction
+    after writing it to a pooled scoreboard; its data is dropped and the
+    instance re-issued once the comparison completes.
+
+    Attributes:
+        max_size: High-watermark on the number of idle pooled instances.
+
+    Usage Example:
+        pool = TransactionPool()
+        sb = Scoreboard("my_sb", transaction_pool=pool)
+        sb.write_actual(pool.acquire("data_A"))
+        sb.write_expected(pool.acquire("data_A"))
+    """
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._pool = collections.deque()
+
+    def acquire(self, data, timestamp=None, _time=time.time):
+        """Return a Transaction wrapping data, reusing a pooled instance if possible.
+
+        Args:
+            data: The data content for the transaction.
+            timestamp (float, optional): Explicit timestamp; defaults to now.
+
+        Returns:
+            Transaction: A recycled or freshly constructed instance.
+        """
+        if self._pool:
+            txn = self._pool.pop()
+            txn.data = data
+            # The recycled instance carries new data on a new line, so any
+            # repr rendered in its previous life is stale
+            txn._repr_cache = None
+            if timestamp is not None:
+                txn.timestamp = timestamp
+            else:
+                txn.timestamp = _time() if Transaction.CAPTURE_TIMESTAMP else 0.0
+        else:
+            txn = Transaction(data, timestamp)
+        # Re-capture the line number from this call site, not the pool's
+        if Transaction.CAPTURE_LINE:
+            try:
+                txn.line = sys._getframe(1).f_lineno
+            except ValueError:
+                txn.line = None
+        else:
+            txn.line = None
+        return txn
+
+    def release(self, transaction):
+        """Return a Transaction to the pool for later reuse.
+
+        The transaction's data reference is dropped so the pool does not
+        keep payloads alive. Instances of Transaction subclasses are not
+        recycled since acquire() only re-initializes base attributes.
+
+        Args:
+            transaction (Transaction): The transaction to recycle.
+        """
+        if type(transaction) is Transaction and len(self._pool) < self.max_size:
+            transaction.data = None
+            self._pool.append(transaction)
+
+
+class _ComparisonThread(threading.Thread):
+    """Dedicated worker thread that drains and compares transaction pairs.
+
+    A Thread subclass rather than a target= function, so the hot loop lives
+    in run() where every shared attribute is pre-bound to a local and the
+    loop body executes on LOAD_FAST lookups only. The happy path has no
+    per-iteration exception dispatch: waiting is event-driven and errors
+    are handled per batch.
+
+    The thread blocks on _data_available with no timeout, so an idle
+    scoreboard consumes zero CPU: producers wake it when a pair becomes
+    available, and stop() wakes it via the same condition after setting
+    _stop_event, at which point it drains any remaining complete pairs
+    and exits. There is deliberately no polling interval or sleep here.
+    """
+
+    def __init__(self, scoreboard):
+        super().__init__(name=f"{scoreboard.name}-comparison")
+        self._scoreboard = scoreboard
+
+    def run(self):
+        """Continuously compares transactions until stopped."""
+        sb = self._scoreboard
+        sb._log(f"Comparison thread started.")
+
+        # Bind frequently used attributes to locals so the loop body runs on
+        # fast LOAD_FAST lookups instead of repeated attribute resolution
+        data_available = sb._data_available
+        shards = list(zip(sb._actual_queues, sb._expected_queues))
+        pair_queue = sb._pair_queue
+        pair_popleft = pair_queue.popleft
+        stop_is_set = sb._stop_event.is_set
+        batch_size = sb._COMPARE_BATCH_SIZE
+        publish = sb._publish_batch
+        actual_ring = sb._actual_ring
+        expected_ring = sb._expected_ring
+        pairs_ready = lambda: stop_is_set() or pair_queue or (
+            actual_ring is not None and actual_ring and expected_ring) or any(
+            aq and eq for aq, eq in shards)
+
+        while True:
+            batches = []
+            with data_available:
+                # Sleep until a full pair is available or a stop is requested;
+                # stop() notifies the condition so there is no polling
+                # timeout. Ring producers skip the condition entirely, so
+                # advertise idleness first: they notify only when this flag
+                # is set, and the GIL orders the flag write against their
+                # ring publishes, so a wakeup is never lost.
+                sb._consumer_idle = True
+                data_available.wait_for(pairs_ready)
+                sb._consumer_idle = False
+                # Pre-paired tuples first: they are complete by construction
+                if pair_queue:
+                    drained = [pair_popleft() for _ in range(
+                        min(len(pair_queue), batch_size))]
+                    actual_part, expected_part = zip(*drained)
+                    batches.append((list(actual_part), list(expected_part)))
+                # Round-robin the shards, draining up to a full batch of
+                # pairs from each under a single acquisition
+                for actual_queue, expected_queue in shards:
+                    pair_count = min(len(actual_queue),
+                                     len(expected_queue),
+                                     batch_size)
+                    if pair_count:
+                        actual_popleft = actual_queue.popleft
+                        expected_popleft = expected_queue.popleft
+                        batches.append(
+                            ([actual_popleft() for _ in range(pair_count)],
+                             [expected_popleft() for _ in range(pair_count)]))
+                # Finally the SPSC rings; pop is lock-free, the condition is
+                # only held here to share the break-on-stop logic below
+                if actual_ring is not None:
+                    pair_count = min(len(actual_ring),
+                                     len(expected_ring),
+                                     batch_size)
+                    if pair_count:
+                        actual_pop = actual_ring.pop
+                        expected_pop = expected_ring.pop
+                        batches.append(
+                            ([actual_pop() for _ in range(pair_count)],
+                             [expected_pop() for _ in range(pair_count)]))
+                if not batches:
+                    # Stop requested and no complete pair left to drain
+                    break
+                # Wake any producers blocked on a full queue
+                data_available.notify_all()
+
+            for actual_batch, expected_batch in batches:
+                publish(actual_batch, expected_batch)
+
+        sb._log(f"Comparison thread stopped.")
+
 
 class Scoreboard:
     """
     A simple scoreboard class for comparing actual vs. expected data streams.
 
-    Inspired by verification scoreboard concepts. It uses queues to handle
-    asynchronous data arrival and performs comparisons.
+    Inspired by verification scoreboard concepts. Asynchronously arriving
+    data is buffered in plain deques coordinated by one condition variable,
+    which is considerably lighter than queue.Queue's reentrant lock plus
+    three conditions and task-done bookkeeping.
+
+    Locking discipline: user-provided __eq__ implementations run with no
+    scoreboard lock held. Comparisons of C-backed payloads (e.g. NumPy
+    arrays) that release the GIL internally therefore overlap with
+    producers, which only ever touch _data_available for an append and a
+    notify. Keep it that way: never call into transaction payloads while
+    holding _data_available.
+
+    The comparison results themselves need no lock: the comparison thread
+    is their only writer, and int rebinding plus list.extend are atomic
+    under the GIL, so report() always observes a consistent prefix.
 
     Attributes:
         name: The name of the scoreboard instance.
         test_description: A description of the test case.
-        _actual_queue: Queue for actual data received from the test environment.
-        _expected_queue: Queue for expected data provided by a reference model.
-        _comparison_lock: Lock for thread-safe access to comparison results.
-        _results: List to store comparison results (True for match, False for mismatch).
-        _mismatches_details: List to store details of mismatches.
+        _actual_queues: Per-shard deques for actual data from the test
+                        environment.
+        _expected_queues: Per-shard deques for expected data from a reference
+                          model.
+        _data_available: Condition guarding all deques; producers notify it.
+        queue_high_watermark: Deepest queue depth observed since start.
+        _total_count: Number of comparisons performed so far.
+        _match_count: Number of comparisons that matched.
+        match_history: Per-comparison outcome bytes (1 for match), or None
+                       unless record_history was requested.
+        _mm_detail: Pre-rendered multi-line detail block per mismatch
+                    (parallel list).
+        _mm_line: Producer line numbers of mismatches (parallel list).
         _running: Flag to indicate if the scoreboard is actively comparing.
-        _comparison_thread: Thread for performing comparison in the background.
+        _comparison_thread: _ComparisonThread performing comparison in the
+                            background.
         _stop_event: Event to signal the comparison thread to stop.
     """
 
-    def __init__(self, name="scoreboard", test_description=None):
+    # Maximum number of transaction pairs drained per lock acquisition.
+    # Larger batches amortize condition acquisitions further but delay both
+    # mismatch logging and producer wakeups during sustained bursts; unpaired
+    # leftovers simply stay in their deque until the partner side arrives,
+    # so no carry buffer or re-enqueueing is ever needed.
+    _COMPARE_BATCH_SIZE = 64
+    # Maximum number of log messages retained for reporting
+    _LOG_BUFFER_SIZE = 10000
+
+    def __init__(self, name="scoreboard", test_description=None,
+                 transaction_pool=None, max_queue_size=10000, shard_count=1,
+                 verbose=False, capture_lines=True, validate_inputs=False,
+                 record_history=False, spsc_ring_size=0, mode="async"):
         """
         Initializes the scoreboard.
 
         Args:
             name (str): The name of the scoreboard instance.
             test_description (str, optional): A description of the test case.
+            transaction_pool (TransactionPool, optional): Pool that matched
+                transactions are released back to after comparison.
+            max_queue_size (int): Upper bound on each pending-transaction
+                queue. Producers that overrun it block briefly for the
+                comparison thread to catch up, then drop with a warning.
+            shard_count (int): Number of queue shards. Producer threads pick
+                a shard by thread identity, so concurrent writers spread
+                across shards instead of contending on one queue. Each
+                producer thread must write its actual and expected streams
+                itself for pairing to hold; the default of 1 preserves
+                strict global FIFO pairing.
+            verbose (bool): True to print (and buffer) per-transaction log
+                lines from the start; equivalent to calling set_verbose().
+            capture_lines (bool): When False, disables Transaction line
+                capture globally (Transaction.CAPTURE_LINE), skipping the
+                frame walk on every construction. Mismatch reports then
+                simply omit the line number.
+            validate_inputs (bool): When True, the write_* methods raise
+                TypeError for non-Transaction arguments. The default trusts
+                producers and skips the per-call type check entirely.
+            record_history (bool): When True, keep a per-comparison record
+                of outcomes in match_history (one byte per comparison, 1
+                for match) for debugging replay. A bytearray costs one byte
+                per entry versus ~28 for a list of bools; the default keeps
+                no history at all since the report only needs the counters.
+            spsc_ring_size (int): When positive, route write_actual and
+                write_expected through lock-free single-producer rings of
+                (at least) this capacity instead of the locked queues. Only
+                valid with shard_count=1, and only correct when a single
+                thread produces each stream. A full ring applies the same
+                wait-then-drop back-pressure as the locked path.
+            mode (str): "async" (default) runs comparisons on a background
+                thread started by start(). "sync" compares inline in the
+                write_* calls on the caller's thread: no thread, no lock,
+                and no settling sleeps in tests; start() and stop() become
+                no-ops. Only valid single-threaded.
+
+        Raises:
+            ValueError: If mode is unknown, or spsc_ring_size is combined
+                with shard_count > 1.
         """
+        if mode not in ("sync", "async"):
+            raise ValueError(f"mode must be 'sync' or 'async', got {mode!r}")
+        self._mode = mode
         self.name = name
         self.test_description = test_description
-        # Queue for actual data received from the test environment
-        self._actual_queue = queue.Queue()
-        # Queue for expected data provided by a reference model or generator
-        self._expected_queue = queue.Queue()
-        # Lock for thread-safe access to comparison results and mismatches
-        self._comparison_lock = threading.Lock()
-        # List to store comparison results (True for match, False for mismatch)
-        self._results = []
-        # List to store details of mismatches (actual, expected)
-        self._mismatches_details = []
-        # List to store all log messages
-        self._log_messages = []
+        self._transaction_pool = transaction_pool
+        self._max_queue_size = max_queue_size
+        self._shard_count = shard_count
+        self._validate_inputs = validate_inputs
+        # Deepest queue depth seen; useful for sizing max_queue_size
+        self.queue_high_watermark = 0
+        # Per-shard deques for actual data received from the test environment.
+        # deque.append/popleft are atomic C-level operations, so a single
+        # condition is enough to coordinate producers and the consumer.
+        self._actual_queues = [collections.deque() for _ in range(shard_count)]
+        # Per-shard deques for expected data from a reference model/generator
+        self._expected_queues = [collections.deque() for _ in range(shard_count)]
+        # Deque of pre-paired (actual, expected) tuples from write_pair;
+        # one enqueue per pair and no reliance on cross-stream ordering
+        self._pair_queue = collections.deque()
+        # Condition guarding all deques; producers notify the comparison
+        # thread when new data arrives
+        self._data_available = threading.Condition()
+        # Optional lock-free SPSC fast path: one ring per stream, each fed
+        # by exactly one producer thread and drained only by the comparison
+        # thread. _consumer_idle tells producers whether a wakeup notify is
+        # needed at all; the GIL orders the flag against ring publishes.
+        if spsc_ring_size:
+            if shard_count != 1:
+                raise ValueError(
+                    "spsc_ring_size requires shard_count=1: the rings "
+                    "assume a single producer per stream")
+            capacity = 1
+            while capacity < spsc_ring_size:
+                capacity <<= 1
+            self._actual_ring = _SPSCRing(capacity)
+            self._expected_ring = _SPSCRing(capacity)
+        else:
+            self._actual_ring = None
+            self._expected_ring = None
+        self._consumer_idle = False
+        # Counters for comparisons performed and matches seen; the report only
+        # ever needs the totals, so no per-comparison history is kept.
+        # The comparison thread is the sole writer, so no lock is needed.
+        self._total_count = 0
+        self._match_count = 0
+        # Optional per-comparison outcome record; bools are int subclasses,
+        # so match results extend the bytearray directly as 1/0 bytes
+        self.match_history = bytearray() if record_history else None
+        # Mismatch details as two parallel lists rather than a dict per
+        # mismatch, which saves the ~240 bytes of dict overhead per entry.
+        # Each detail is a fully rendered text block built when the mismatch
+        # occurs, so report() never re-formats anything, and no transaction
+        # objects are kept alive by the report.
+        self._mm_detail = []
+        self._mm_line = []
+        # HTML rows for mismatches, rendered incrementally as they occur so
+        # report() does not rebuild the table from scratch
+        self._html_rows = []
+        # Bounded buffer of log messages kept for reporting
+        self._log_messages = collections.deque(maxlen=self._LOG_BUFFER_SIZE)
+        # When False, per-transaction log lines are routed to the logging
+        # module (lazily formatted) instead of being printed and buffered
+        self._verbose = verbose
+        # Library-style logger: silent by default via NullHandler, so hosts
+        # that configure logging get the debug traffic and nobody else pays
+        self._logger = logging.getLogger(self.name)
+        if not self._logger.handlers:
+            self._logger.addHandler(logging.NullHandler())
+        # Benchmark/production convenience: turn off the per-transaction
+        # frame walk for everyone producing into this process
+        if not capture_lines:
+            Transaction.CAPTURE_LINE = False
         # Flag to indicate if the scoreboard is actively comparing
         self._running = False
         # Thread for performing comparison in the background
@@ -128,12 +666,106 @@ class Scoreboard:
 
         self._log(f"Scoreboard initialized.")
 
-    def _log(self, message):
-        """Logs a message to the console and stores it for reporting."""
+    def _enqueue(self, dq, transaction, label):
+        """Appends a transaction to a queue, applying back-pressure when full.
+
+        A full queue means the producers have overrun the comparison thread.
+        The producer waits up to one second for the queue to drain; if it is
+        still full after that, the transaction is dropped with a warning
+        rather than letting memory grow without bound.
+
+        Args:
+            dq (collections.deque): The target queue.
+            transaction (Transaction): The transaction to enqueue.
+            label (str): Queue name used in the overflow warning.
+
+        Returns:
+            bool: True if the transaction was enqueued, False if dropped.
+        """
+        with self._data_available:
+            if len(dq) >= self._max_queue_size:
+                self._data_available.wait_for(
+                    lambda: len(dq) < self._max_queue_size
+                    or self._stop_event.is_set(),
+                    timeout=1.0,
+                )
+            if len(dq) >= self._max_queue_size:
+                dropped = True
+            else:
+                dropped = False
+                dq.append(transaction)
+                depth = len(dq)
+                if depth > self.queue_high_watermark:
+                    self.queue_high_watermark = depth
+                self._data_available.notify()
+        if dropped:
+            self._log(f"Warning: {label} queue full; dropped {transaction}")
+            return False
+        return True
+
+    def _ring_push(self, ring, transaction, label, _monotonic=time.monotonic):
+        """Pushes a transaction onto an SPSC ring without taking the lock.
+
+        The condition is only touched when the consumer has advertised that
+        it is idle, so a producer hammering a busy scoreboard never blocks.
+        A full ring gets the same treatment as a full queue: wait up to one
+        second for the consumer to catch up, then drop with a warning.
+
+        Args:
+            ring (_SPSCRing): The target ring.
+            transaction (Transaction): The transaction to push.
+            label (str): Stream name used in the overflow warning.
+
+        Returns:
+            bool: True if the transaction was pushed, False if dropped.
+        """
+        pushed = ring.push(transaction)
+        if not pushed:
+            deadline = _monotonic() + 1.0
+            while not pushed and _monotonic() < deadline:
+                time.sleep(0.001)
+                pushed = ring.push(transaction)
+        if not pushed:
+            self._log(f"Warning: {label} ring full; dropped {transaction}")
+            return False
+        if self._consumer_idle:
+            with self._data_available:
+                self._data_available.notify()
+        return True
+
+    def _log(self, message, debug=False):
+        """Logs a message to the console and stores it for reporting.
+
+        Debug-level messages (per-transaction traffic) are only printed when
+        verbose mode is enabled; they are still stored for the report log.
+        """
         full_message = f"[{self.name}] {message}"
-        print(full_message)
+        if not debug or self._verbose:
+            print(full_message)
         self._log_messages.append(full_message)
 
+    def _log_debug(self, fmt, *args):
+        """Logs per-transaction traffic with lazy formatting.
+
+        In verbose mode the line is formatted, printed, and buffered like any
+        other log message. Otherwise it goes to the logging module with
+        %-style arguments, so repr() of the transactions is only ever invoked
+        if a handler is actually enabled for DEBUG.
+        """
+        if self._verbose:
+            self._log(fmt % args, debug=True)
+        else:
+            self._logger.debug(fmt, *args)
+
+    def set_verbose(self, verbose=True):
+        """Enables or disables console printing of per-transaction log lines.
+
+        Args:
+            verbose (bool): True to print every received/match line, False to
+                            print only lifecycle and mismatch messages.
+        """
+        self._verbose = verbose
+
     def write_actual(self, transaction: Transaction):
         """
         Receives an actual transaction from the test environment.
@@ -142,13 +774,26 @@ class Scoreboard:
             transaction (Transaction): The actual transaction object.
 
         Raises:
-            ValueError: If the transaction is not an instance of Transaction.
+            TypeError: If validate_inputs is enabled and the argument is not
+                       a Transaction.
         """
-        if not isinstance(transaction, Transaction):
-            self._log(f"Warning: Received non-Transaction object for actual data.")
+        if self._validate_inputs and not isinstance(transaction, Transaction):
+            raise TypeError(
+                f"write_actual expects a Transaction, "
+                f"got {type(transaction).__name__}")
+        if self._mode == "sync":
+            self._log_debug("Received actual: %r", transaction)
+            self._actual_queues[0].append(transaction)
+            self._drain_sync()
             return
-        self._actual_queue.put(transaction)
-        self._log(f"Received actual: {transaction}")
+        ring = self._actual_ring
+        if ring is not None:
+            if self._ring_push(ring, transaction, "actual"):
+                self._log_debug("Received actual: %r", transaction)
+            return
+        shard = threading.get_ident() % self._shard_count
+        if self._enqueue(self._actual_queues[shard], transaction, "actual"):
+            self._log_debug("Received actual: %r", transaction)
 
     def write_expected(self, transaction: Transaction):
         """
@@ -158,78 +803,247 @@ class Scoreboard:
             transaction (Transaction): The expected transaction object.
 
         Raises:
-            ValueError: If the transaction is not an instance of Transaction.
+            TypeError: If validate_inputs is enabled and the argument is not
+                       a Transaction.
         """
-        if not isinstance(transaction, Transaction):
-            self._log(f"Warning: Received non-Transaction object for expected data.")
+        if self._validate_inputs and not isinstance(transaction, Transaction):
+            raise TypeError(
+                f"write_expected expects a Transaction, "
+                f"got {type(transaction).__name__}")
+        if self._mode == "sync":
+            self._log_debug("Received expected: %r", transaction)
+            self._expected_queues[0].append(transaction)
+            self._drain_sync()
+            return
+        ring = self._expected_ring
+        if ring is not None:
+            if self._ring_push(ring, transaction, "expected"):
+                self._log_debug("Received expected: %r", transaction)
             return
-        self._expected_queue.put(transaction)
-        self._log(f"Received expected: {transaction}")
+        shard = threading.get_ident() % self._shard_count
+        if self._enqueue(self._expected_queues[shard], transaction, "expected"):
+            self._log_debug("Received expected: %r", transaction)
 
-    def _compare_transactions(self):
+    def write_pair(self, actual: Transaction, expected: Transaction):
         """
-        Internal method to continuously compare transactions from the queues.
-        Runs in a separate thread.
+        Receives a pre-paired actual/expected transaction couple.
+
+        When the caller already knows which expected transaction belongs to
+        which actual one, this is both cheaper (a single enqueue instead of
+        two) and safer (pairing no longer depends on FIFO ordering across
+        the two streams).
+
+        Args:
+            actual (Transaction): The actual transaction object.
+            expected (Transaction): The expected transaction object.
+
+        Raises:
+            TypeError: If validate_inputs is enabled and either argument is
+                       not a Transaction.
         """
-        self._log(f"Comparison thread started.")
-        while not self._stop_event.is_set() or not (self._actual_queue.empty() and self._expected_queue.empty()):
-            actual_txn = None
-            expected_txn = None
+        if self._validate_inputs and not (
+                isinstance(actual, Transaction)
+                and isinstance(expected, Transaction)):
+            raise TypeError("write_pair expects Transaction arguments")
+        if self._mode == "sync":
+            self._log_debug("Received pair: Actual=%r, Expected=%r",
+                            actual, expected)
+            self._publish_batch([actual], [expected])
+            return
+        if self._enqueue(self._pair_queue, (actual, expected), "pair"):
+            self._log_debug("Received pair: Actual=%r, Expected=%r",
+                            actual, expected)
 
-            try:
-                # Attempt to get transactions with a timeout
-                actual_txn = self._actual_queue.get(timeout=0.1)
-                expected_txn = self._expected_queue.get(timeout=0.1)
-
-                match = (actual_txn == expected_txn)
-
-                with self._comparison_lock:
-                    self._results.append(match)
-                    if not match:
-                        # Store mismatch details
-                        self._mismatches_details.append({
-                            "actual": actual_txn,
-                            "expected": expected_txn,
-                            "line": actual_txn.line
-                        })
-
-
-                if match:
-                    self._log(f"MATCH: Actual={actual_txn}, Expected={expected_txn}")
-                else:
-                    self._log(f"MISMATCH: Actual={actual_txn}, Expected={expected_txn}")
-
-            except queue.Empty:
-                # If one queue is empty, wait a bit before checking again
-                # This handles cases where data arrives asynchronously
-                time.sleep(0.01)
-            except Exception as e:
-                self._log(f"Error during comparison: {e}")
-                # In case of error, mark as mismatch for safety
-                with self._comparison_lock:
-                     self._results.append(False)
-                     # Store error details as a mismatch
-                     self._mismatches_details.append({
-                         "error": str(e),
-                         "actual": actual_txn, # May be None
-                         "expected": expected_txn # May be None
-                     })
-
-
-        self._log(f"Comparison thread stopped.")
+    def _publish_batch(self, actual_batch, expected_batch):
+        """Compares one batch of positionally paired transactions and
+        publishes the results.
+
+        Shared by the comparison thread and synchronous mode. Runs with no
+        lock held: the caller is the sole writer of the result state, and
+        the publishes below are GIL-atomic (see the class docstring).
+
+        Args:
+            actual_batch (list): Transactions from the test environment.
+            expected_batch (list): Positionally paired reference
+                                   transactions.
+        """
+        try:
+            # Compare the whole batch without holding any lock, so a
+            # slow or GIL-releasing user __eq__ never stalls producers
+            matches = _compare_batch(actual_batch, expected_batch)
+        except Exception:
+            # One raising __eq__ poisons the whole C-level kernel. Fall
+            # back to comparing this batch pair by pair so the offending
+            # pair costs only its own error entry and every other result
+            # in the batch - including genuine mismatches - is still
+            # published and counted.
+            for actual_txn, expected_txn in zip(actual_batch, expected_batch):
+                self._publish_pair(actual_txn, expected_txn)
+            return
+        try:
+            self._publish_results(actual_batch, expected_batch, matches)
+        except Exception:
+            # A batch can also be poisoned after the kernel succeeds: an
+            # __eq__ may return a result with ambiguous truthiness (e.g.
+            # an array), which raises only when _publish_results tests it.
+            # That raise fires in the mismatch comprehension before any
+            # state is mutated, so the same pair-by-pair remedy applies
+            # without double-publishing anything.
+            for actual_txn, expected_txn in zip(actual_batch, expected_batch):
+                self._publish_pair(actual_txn, expected_txn)
+
+    def _publish_pair(self, actual, expected):
+        """Compares and publishes a single pair, recording a raising
+        __eq__ as an error entry instead of letting it poison its batch."""
+        try:
+            match = actual == expected
+            self._publish_results([actual], [expected], [match])
+        except Exception as e:
+            self._log(f"Error during comparison: {e}")
+            self._record_comparison_error(e)
+
+    def _record_comparison_error(self, error):
+        """Publishes a failed comparison as a mismatch entry for safety.
+
+        Args:
+            error (Exception): The exception the comparison raised.
+        """
+        html_rows = self._html_rows
+        self._mm_detail.append(f"  Error: {error}")
+        self._mm_line.append(None)
+        html_rows.append(_html_mismatch_row(
+            len(html_rows) + 1, None, None, None, str(error)))
+        if self.match_history is not None:
+            self.match_history.append(0)
+        self._total_count += 1
+
+    def _publish_results(self, actual_batch, expected_batch, matches):
+        """Publishes a batch of already-computed comparison outcomes.
+
+        Single-writer publishes: int rebinding and list.append are atomic
+        under the GIL, so no lock is required here (see the class
+        docstring). Mismatch details and HTML rows land before the
+        counters are bumped, and report() reads the counters before
+        copying the details, so a racing reader can see a detail whose
+        count is not in yet - which fails safe - but never a counted
+        mismatch with no detail, which would print a false pass.
 
+        Args:
+            actual_batch (list): Transactions from the test environment.
+            expected_batch (list): Positionally paired reference
+                                   transactions.
+            matches (list): One truthy value per pair that matched.
+        """
+        pair_count = len(actual_batch)
+        history = self.match_history
+        mm_detail_append = self._mm_detail.append
+        mm_line_append = self._mm_line.append
+        html_rows = self._html_rows
+        mismatch_pairs = [
+            (a, e)
+            for a, e, match in zip(actual_batch, expected_batch, matches)
+            if not match
+        ]
+
+        for a, e in mismatch_pairs:
+            # Render the full detail block now, on the comparison
+            # caller's budget; storing strings instead of references
+            # lets mismatched transactions be recycled immediately
+            # and makes report() a pure writer
+            actual_repr = repr(a)
+            expected_repr = repr(e)
+            detail = f"  Actual: {actual_repr}\n  Expected: {expected_repr}"
+            if a.line is not None:
+                detail += f"\n  Line: {a.line}"
+            mm_detail_append(detail)
+            mm_line_append(a.line)
+            html_rows.append(_html_mismatch_row(
+                len(html_rows) + 1, actual_repr, expected_repr,
+                a.line, None))
+
+        # Counters last: only once every detail is in place (see above)
+        self._total_count += pair_count
+        self._match_count += pair_count - len(mismatch_pairs)
+        if history is not None:
+            history.extend(matches)
+
+        for actual_txn, expected_txn, match in zip(
+                actual_batch, expected_batch, matches):
+            if match:
+                self._log_debug("MATCH: Actual=%r, Expected=%r",
+                                actual_txn, expected_txn)
+            else:
+                self._log(f"MISMATCH: Actual={actual_txn}, Expected={expected_txn}")
+
+        # Recycle the whole batch: mismatch details store
+        # pre-rendered strings, so no transaction is referenced
+        # from the report and all of them can be reused
+        pool = self._transaction_pool
+        if pool is not None:
+            release = pool.release
+            for actual_txn, expected_txn in zip(
+                    actual_batch, expected_batch):
+                release(actual_txn)
+                release(expected_txn)
+
+    def _drain_sync(self):
+        """Compares every complete pair currently buffered, inline."""
+        actual_queue = self._actual_queues[0]
+        expected_queue = self._expected_queues[0]
+        pair_count = min(len(actual_queue), len(expected_queue))
+        if pair_count:
+            actual_popleft = actual_queue.popleft
+            expected_popleft = expected_queue.popleft
+            self._publish_batch(
+                [actual_popleft() for _ in range(pair_count)],
+                [expected_popleft() for _ in range(pair_count)])
+
+    def flush(self, timeout=5.0):
+        """Ensures every complete pair received so far has been compared.
+
+        In synchronous mode this compares any buffered pairs inline and
+        returns immediately. In asynchronous mode it waits for the
+        comparison thread to catch up, up to the given timeout.
+
+        Args:
+            timeout (float): Maximum seconds to wait in asynchronous mode.
+
+        Returns:
+            bool: True once no complete pair remains unprocessed.
+        """
+        if self._mode == "sync":
+            self._drain_sync()
+            return True
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._data_available:
+                pending = bool(self._pair_queue) or any(
+                    aq and eq for aq, eq in zip(self._actual_queues,
+                                                self._expected_queues))
+            if not pending and self._actual_ring is not None:
+                pending = bool(self._actual_ring) and bool(self._expected_ring)
+            if not pending:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
 
     def start(self):
         """
         Starts the background comparison thread.
 
+        In synchronous mode this is a no-op: comparisons happen inline in
+        the write_* calls.
+
         Raises:
             RuntimeError: If the scoreboard is already running.
         """
+        if self._mode == "sync":
+            return
         if not self._running:
             self._running = True
             self._stop_event.clear()
-            self._comparison_thread = threading.Thread(target=self._compare_transactions)
+            self._comparison_thread = _ComparisonThread(self)
             self._comparison_thread.start()
             self._log(f"Scoreboard started.")
         else:
@@ -239,12 +1053,19 @@ class Scoreboard:
         """
         Stops the background comparison thread and waits for it to finish.
 
+        In synchronous mode this is a no-op.
+
         Raises:
             RuntimeError: If the scoreboard is not running.
         """
+        if self._mode == "sync":
+            return
         if self._running:
             self._log(f"Stopping scoreboard...")
             self._stop_event.set() # Signal thread to stop
+            with self._data_available:
+                # Wake the comparison thread so it notices the stop request
+                self._data_available.notify_all()
             if self._comparison_thread and self._comparison_thread.is_alive():
                  self._comparison_thread.join(timeout=5) # Wait for thread to finish
                  if self._comparison_thread.is_alive():
@@ -255,7 +1076,8 @@ class Scoreboard:
             self._log(f"Scoreboard is not running.")
 
 
-    def report(self, output_file=None, format='text'):
+    def report(self, output_file=None, format='text', verbose=True,
+               fsync=False):
         """
         Generates a report based on the comparison results and optionally writes it to a file.
         Includes details for any mismatches found.
@@ -265,6 +1087,13 @@ class Scoreboard:
                                      If None, the report is only printed to the console.
             format (str): The format of the report ('text' or 'html').
                           If 'html', the output_file should have an .html extension.
+            verbose (bool): When False and every comparison passed, skip
+                            formatting and printing entirely and just return
+                            True. Useful in CI sweeps where only failures
+                            warrant a report.
+            fsync (bool): When True, force the written report to stable
+                          storage before returning. Off by default; the
+                          flush-to-disk wait dwarfs the write itself.
 
         Returns:
             bool: True if all comparisons were successful, False otherwise.
@@ -272,83 +1101,112 @@ class Scoreboard:
         Raises:
             IOError: If there's an error writing to the output file.
         """
+        # Common-case fast path: everything matched and nobody asked for
+        # output, so there is nothing worth formatting. The counter is read
+        # before the detail list so an in-flight mismatch (whose detail
+        # lands before its count) can never slip past as a pass.
+        if (not verbose and output_file is None and self._total_count > 0
+                and not self._mm_detail):
+            return True
+
         if format == 'html':
             if not output_file or not output_file.endswith('.html'):
                 self._log(f"Error: HTML format requires an output file ending with .html.")
                 return False
             report_content = self._generate_html_report()
             try:
-                with open(output_file, 'w') as f:
-                    f.write(report_content)
+                self._write_report_file(output_file, report_content, fsync)
                 self._log(f"HTML report saved to {output_file}")
             except IOError as e:
                 self._log(f"Error writing HTML report to {output_file}: {e}")
                 return False
-            return len(self._mismatches_details) == 0 and len(self._results) > 0
+            # Counter before detail list, same fail-safe order as below
+            return self._total_count > 0 and len(self._mm_line) == 0
+
+        # Text-based reporting: accumulate every line and emit with a single
+        # write instead of one (or two) syscalls per line
+        lines = []
+        append = lines.append
+
+        # Snapshot the shared state once, before any formatting. The writer
+        # appends a mismatch's detail before bumping the counters, so by
+        # reading the counters first and copying the detail list after, a
+        # report racing a publish can at worst see an extra detail - never
+        # a counted mismatch with no detail - and so can never print a
+        # false pass. No formatting or I/O races the comparison thread.
+        total_comparisons = self._total_count
+        matches = self._match_count
+        details = list(self._mm_detail)
+        mismatches = len(details)
+
+        append(f"\n[{self.name}] --- Scoreboard Report ---")
+        if self.test_description:
+            append(f"Test Description: {self.test_description}")
+
+        append(f"Total comparisons: {total_comparisons}")
+        append(f"Matches: {matches}")
+        append(f"Mismatches: {mismatches}")
+
+        success = (mismatches == 0 and total_comparisons > 0)
+
+        if mismatches > 0:
+            append("\n--- Mismatch Details ---")
+            # Each detail block was rendered when the mismatch occurred
+            for i, detail in enumerate(details, 1):
+                append(f"Mismatch {i}:")
+                append(detail)
+            append("------------------------")
+
+        if success:
+            append(f"[{self.name}] TEST PASSED: No mismatches found.")
+        elif total_comparisons == 0:
+            append(f"[{self.name}] WARNING: No comparisons were performed.")
+            success = False
+        else:
+            append(f"[{self.name}] TEST FAILED: Mismatches detected.")
+
+        append(f"[{self.name}] ---------------------------\n")
 
-        # Text-based reporting
-        f = None
+        content = "\n".join(lines) + "\n"
         try:
             if output_file:
-                f = open(output_file, 'w')
-            else:
-                f = sys.stdout
-
-            def write_line(line):
-                """Helper function to write to the specified output."""
-                print(line, file=f)
-                if f != sys.stdout:
-                    print(line) # Also print to console if writing to a file
-
-            write_line(f"\n[{self.name}] --- Scoreboard Report ---")
-            if self.test_description:
-                write_line(f"Test Description: {self.test_description}")
-            total_comparisons = len(self._results)
-            mismatches = len(self._mismatches_details)
-            matches = total_comparisons - mismatches
-
-            write_line(f"Total comparisons: {total_comparisons}")
-            write_line(f"Matches: {matches}")
-            write_line(f"Mismatches: {mismatches}")
-
-            success = (mismatches == 0 and total_comparisons > 0)
-
-            if mismatches > 0:
-                write_line("\n--- Mismatch Details ---")
-                for i, mismatch in enumerate(self._mismatches_details):
-                    write_line(f"Mismatch {i+1}:")
-                    if "error" in mismatch:
-                        write_line(f"  Error: {mismatch['error']}")
-                    write_line(f"  Actual: {mismatch.get('actual', 'N/A')}")
-                    write_line(f"  Expected: {mismatch.get('expected', 'N/A')}")
-                    if mismatch.get('line') is not None:
-                        write_line(f"  Line: {mismatch.get('line')}")
-                write_line("------------------------")
-
-            if success:
-                write_line(f"[{self.name}] TEST PASSED: No mismatches found.")
-            elif total_comparisons == 0:
-                write_line(f"[{self.name}] WARNING: No comparisons were performed.")
-                success = False
-            else:
-                write_line(f"[{self.name}] TEST FAILED: Mismatches detected.")
-
-            write_line(f"[{self.name}] ---------------------------\n")
-
+                self._write_report_file(output_file, content, fsync)
+            # Mirror the report to the console, in one write
+            sys.stdout.write(content)
             return success
-
         except IOError as e:
             self._log(f"Error writing report: {e}")
             return False
-        finally:
-            if f and f != sys.stdout:
-                f.close()
+
+    @staticmethod
+    def _write_report_file(output_file, content, fsync):
+        """Writes a fully assembled report to disk in one write.
+
+        The file is opened in binary mode and the report encoded once, so
+        the whole payload goes down in a single write call with no text-
+        layer re-encoding. fsync is opt-in for callers that need the
+        report on stable storage before continuing.
+
+        Args:
+            output_file (str): Destination path.
+            content (str): The complete report text.
+            fsync (bool): True to flush the file to disk before returning.
+        """
+        with open(output_file, 'wb') as f:
+            f.write(content.encode('utf-8'))
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
 
     def _generate_html_report(self):
         """Generates an HTML report of the scoreboard results."""
-        total_comparisons = len(self._results)
-        mismatches_count = len(self._mismatches_details)
-        matches_count = total_comparisons - mismatches_count
+        # Same snapshot discipline as the text path: read the counters
+        # first, then copy the rendered rows, and format from the locals
+        # only, so a racing publish can only ever add an extra row
+        total_comparisons = self._total_count
+        matches_count = self._match_count
+        rows = list(self._html_rows)
+        mismatches_count = len(rows)
         
         if total_comparisons == 0:
             success = False
@@ -359,47 +1217,45 @@ class Scoreboard:
             status = "PASSED" if success else "FAILED"
             status_color = "green" if success else "red"
 
-        # HTML Body
-        body = f"""
-        <h1>Scoreboard Report: {self.name}</h1>
-        <h2>Test Description: {self.test_description or 'N/A'}</h2>
+        # Escape dynamic fields once; accumulate pieces in a list and join
+        # at the end instead of growing a string with repeated +=
+        safe_name = html.escape(self.name)
+        safe_description = html.escape(self.test_description or 'N/A')
+
+        parts = [f"""
+        <h1>Scoreboard Report: {safe_name}</h1>
+        <h2>Test Description: {safe_description}</h2>
         <hr>
         <h2>Summary</h2>
         <p><strong>Total comparisons:</strong> {total_comparisons}</p>
         <p><strong>Matches:</strong> {matches_count}</p>
         <p><strong>Mismatches:</strong> {mismatches_count}</p>
         <h2 style="color:{status_color};">Overall Status: {status}</h2>
-        """
+        """]
 
         if total_comparisons == 0:
-            body += "<p><strong>Warning:</strong> No comparisons were performed.</p>"
+            parts.append("<p><strong>Warning:</strong> No comparisons were performed.</p>")
 
         if mismatches_count > 0:
-            body += "<h2>Mismatch Details</h2>"
-            body += "<table border='1'><tr><th>#</th><th>Details</th></tr>"
-            for i, mismatch in enumerate(self._mismatches_details):
-                details = ""
-                if "error" in mismatch:
-                    details += f"<strong>Error:</strong> {mismatch['error']}<br>"
-                details += f"<strong>Actual:</strong> {mismatch.get('actual', 'N/A')}<br>"
-                details += f"<strong>Expected:</strong> {mismatch.get('expected', 'N/A')}<br>"
-                if mismatch.get('line') is not None:
-                    details += f"<strong>Line:</strong> {mismatch.get('line')}"
-                body += f"<tr><td>{i+1}</td><td>{details}</td></tr>"
-            body += "</table>"
-
-        body += "<h2>Execution Log</h2>"
-        body += f"<pre><code>"
-        for msg in self._log_messages:
-            body += msg + "\n"
-        body += "</code></pre>"
+            parts.append("<h2>Mismatch Details</h2>")
+            parts.append("<table border='1'><tr><th>#</th><th>Details</th></tr>")
+            # Rows were rendered incrementally as mismatches occurred
+            parts.extend(rows)
+            parts.append("</table>")
+
+        parts.append("<h2>Execution Log</h2>")
+        parts.append("<pre><code>")
+        parts.append(html.escape("\n".join(self._log_messages)))
+        parts.append("\n</code></pre>")
+
+        body = "".join(parts)
 
         # Full HTML Document
         html_template = f"""
         <!DOCTYPE html>
         <html>
         <head>
-            <title>Scoreboard Report: {self.name}</title>
+            <title>Scoreboard Report: {safe_name}</title>
             <style>
                 body {{ font-family: Arial, sans-serif; }}
                 h1, h2 {{ color: #333; }}
@@ -420,6 +1276,8 @@ class Scoreboard:
 if __name__ == "__main__":
     # Create a scoreboard instance
     my_scoreboard = Scoreboard("my_test_scoreboard")
+    # Print per-transaction log lines in demonstration mode
+    my_scoreboard.set_verbose()
 
     # Start the scoreboard's comparison thread
     my_scoreboard.start()
@@ -442,9 +1300,9 @@ if __name__ == "__main__":
     my_scoreboard.write_actual(Transaction([1, 2, 3]))
     my_scoreboard.write_expected(Transaction([1, 2, 4])) # Another mismatch
 
-    # Simulate more matching transactions
-    my_scoreboard.write_actual(Transaction({"key": "value"}))
-    my_scoreboard.write_expected(Transaction({"key": "value"}))
+    # Simulate more matching transactions, delivered as a pre-paired couple
+    my_scoreboard.write_pair(Transaction({"key": "value"}),
+                             Transaction({"key": "value"}))
 
     # Allow some time for the comparison thread to process
     time.sleep(0.5)
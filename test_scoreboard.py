@@ -3,7 +3,7 @@ import time
 import os
 import io
 import sys
-from scoreboard import Scoreboard, Transaction
+from scoreboard import Scoreboard, Transaction, TransactionPool
 
 class TestTransaction(unittest.TestCase):
     """Tests for the Transaction class."""
@@ -20,11 +20,104 @@ class TestTransaction(unittest.TestCase):
         t2 = Transaction("data_B")
         self.assertNotEqual(t1, t2, "Transactions with different data should not be equal.")
 
+    def test_subclass_inherits_equality(self):
+        """Test that subclasses inheriting __eq__ still compare by data."""
+        class SubTransaction(Transaction):
+            pass
+        self.assertEqual(SubTransaction("data_A"), SubTransaction("data_A"))
+        self.assertEqual(SubTransaction("data_A"), Transaction("data_A"))
+        self.assertNotEqual(SubTransaction("data_A"), SubTransaction("data_B"))
+
     def test_inequality_with_other_types(self):
         """Test that a transaction is not equal to an object of a different type."""
         t1 = Transaction("data_A")
         self.assertNotEqual(t1, "data_A", "Transaction should not be equal to a non-Transaction object.")
 
+class TestTransactionFromInterned(unittest.TestCase):
+    """Tests for the Transaction.from_interned helper."""
+
+    def test_interned_payloads_share_identity(self):
+        """Test that equal string payloads are interned to the same object."""
+        # Build the payloads at runtime: a literal concatenation would be
+        # constant-folded into one shared object and pass without interning
+        t1 = Transaction.from_interned("".join(["payload", "_x"]))
+        t2 = Transaction.from_interned("".join(["payload", "_x"]))
+        self.assertIs(t1.data, t2.data, "Interned string payloads should be identical objects.")
+        self.assertEqual(t1, t2)
+
+    def test_non_string_payload_unchanged(self):
+        """Test that non-string payloads pass through untouched."""
+        data = [1, 2, 3]
+        t1 = Transaction.from_interned(data)
+        self.assertIs(t1.data, data)
+
+
+class TestTransactionFreelist(unittest.TestCase):
+    """Tests for the Transaction class-level freelist."""
+
+    def tearDown(self):
+        """Drop any instances the test left on the shared freelist."""
+        Transaction._pool.clear()
+
+    def test_acquire_reuses_released_instance(self):
+        """Test that a released transaction is handed out again by acquire."""
+        txn = Transaction.acquire("data_A")
+        txn.release()
+        recycled = Transaction.acquire("data_B")
+        self.assertIs(recycled, txn, "Freelist should reuse the released instance.")
+        self.assertEqual(recycled.data, "data_B")
+
+    def test_scoreboard_recycles_to_freelist(self):
+        """Test that the Transaction class works as a scoreboard pool."""
+        scoreboard = Scoreboard(name="freelist_sb", mode="sync",
+                                transaction_pool=Transaction)
+        scoreboard.write_pair(Transaction.acquire("A"), Transaction.acquire("A"))
+        self.assertEqual(len(Transaction._pool), 2,
+                         "Both matched transactions should be recycled.")
+
+
+class TestTransactionPool(unittest.TestCase):
+    """Tests for the TransactionPool class."""
+
+    def test_acquire_reuses_released_instance(self):
+        """Test that a released transaction is handed out again by acquire."""
+        pool = TransactionPool()
+        txn = pool.acquire("data_A")
+        pool.release(txn)
+        recycled = pool.acquire("data_B")
+        self.assertIs(recycled, txn, "Pool should reuse the released instance.")
+        self.assertEqual(recycled.data, "data_B")
+
+    def test_matched_transactions_return_to_pool(self):
+        """Test that the scoreboard releases matched transactions to its pool."""
+        pool = TransactionPool()
+        scoreboard = Scoreboard(name="pool_sb", transaction_pool=pool)
+        scoreboard.start()
+        scoreboard.write_actual(pool.acquire("A"))
+        scoreboard.write_expected(pool.acquire("A"))
+        time.sleep(0.2)
+        scoreboard.stop()
+        self.assertEqual(len(pool._pool), 2, "Both matched transactions should be recycled.")
+
+
+class _ExplodingData:
+    """A payload whose equality comparison always raises."""
+
+    def __eq__(self, other):
+        raise RuntimeError("boom")
+
+
+class _AmbiguousData:
+    """A payload whose comparison result has ambiguous truthiness,
+    mimicking array-valued __eq__ results."""
+
+    def __eq__(self, other):
+        return self
+
+    def __bool__(self):
+        raise ValueError("ambiguous truth value")
+
+
 class TestScoreboard(unittest.TestCase):
     """Tests for the Scoreboard class."""
 
@@ -45,32 +138,34 @@ class TestScoreboard(unittest.TestCase):
         self.scoreboard.write_expected(Transaction("A"))
         time.sleep(0.2)  # Allow time for comparison
         self.assertTrue(self.scoreboard.report(), "Report should indicate success for a single match.")
-        self.assertEqual(len(self.scoreboard._results), 1)
-        self.assertEqual(len(self.scoreboard._mismatches_details), 0)
+        self.assertEqual(self.scoreboard._total_count, 1)
+        self.assertEqual(len(self.scoreboard._mm_line), 0)
 
     def test_single_mismatch(self):
         """Test a single mismatching transaction pair."""
-        self.scoreboard.write_actual(Transaction("A"))
+        actual = Transaction("A")
+        self.scoreboard.write_actual(actual)
         self.scoreboard.write_expected(Transaction("B"))
         time.sleep(0.2)  # Allow time for comparison
         self.assertFalse(self.scoreboard.report(), "Report should indicate failure for a mismatch.")
-        self.assertEqual(len(self.scoreboard._results), 1)
-        self.assertEqual(len(self.scoreboard._mismatches_details), 1)
-        self.assertEqual(self.scoreboard._mismatches_details[0]['line'], 53)
+        self.assertEqual(self.scoreboard._total_count, 1)
+        self.assertEqual(len(self.scoreboard._mm_line), 1)
+        self.assertEqual(self.scoreboard._mm_line[0], actual.line)
 
     def test_multiple_transactions(self):
         """Test a mix of matching and mismatching transactions."""
         self.scoreboard.write_actual(Transaction(1))
         self.scoreboard.write_expected(Transaction(1))
-        self.scoreboard.write_actual(Transaction(2))
+        mismatching = Transaction(2)
+        self.scoreboard.write_actual(mismatching)
         self.scoreboard.write_expected(Transaction(3)) # Mismatch
         self.scoreboard.write_actual(Transaction(4))
         self.scoreboard.write_expected(Transaction(4))
         time.sleep(0.5)
         self.assertFalse(self.scoreboard.report(), "Report should indicate failure with mixed results.")
-        self.assertEqual(len(self.scoreboard._results), 3)
-        self.assertEqual(len(self.scoreboard._mismatches_details), 1)
-        self.assertEqual(self.scoreboard._mismatches_details[0]['line'], 65)
+        self.assertEqual(self.scoreboard._total_count, 3)
+        self.assertEqual(len(self.scoreboard._mm_line), 1)
+        self.assertEqual(self.scoreboard._mm_line[0], mismatching.line)
 
     def test_no_transactions(self):
         """Test the scoreboard report when no transactions are processed."""
@@ -88,36 +183,139 @@ class TestScoreboard(unittest.TestCase):
         if os.path.exists(report_filename):
             os.remove(report_filename)
 
-        self.scoreboard.write_actual(Transaction("file_test"))
+        actual = Transaction("file_test")
+        self.scoreboard.write_actual(actual)
         self.scoreboard.write_expected(Transaction("file_test_mismatch"))
         time.sleep(0.2)
-        
+
         self.scoreboard.report(output_file=report_filename)
-        
+
         self.assertTrue(os.path.exists(report_filename))
         with open(report_filename, 'r') as f:
             content = f.read()
             self.assertIn("TEST FAILED", content)
             self.assertIn("Total comparisons: 1", content)
-            self.assertIn("Line: 91", content)
+            self.assertIn(f"Line: {actual.line}", content)
 
         os.remove(report_filename)
 
+    def test_write_pair(self):
+        """Test that pre-paired transactions are compared correctly."""
+        self.scoreboard.write_pair(Transaction("A"), Transaction("A"))
+        self.scoreboard.write_pair(Transaction("B"), Transaction("C")) # Mismatch
+        time.sleep(0.2)
+        self.assertFalse(self.scoreboard.report(), "Report should indicate failure for a mismatched pair.")
+        self.assertEqual(self.scoreboard._total_count, 2)
+        self.assertEqual(len(self.scoreboard._mm_line), 1)
+
+    def test_sharded_queues(self):
+        """Test that a sharded scoreboard still pairs transactions correctly."""
+        scoreboard = Scoreboard(name="sharded_sb", shard_count=4)
+        scoreboard.start()
+        scoreboard.write_actual(Transaction("A"))
+        scoreboard.write_expected(Transaction("A"))
+        scoreboard.write_actual(Transaction("B"))
+        scoreboard.write_expected(Transaction("C")) # Mismatch
+        time.sleep(0.2)
+        scoreboard.stop()
+        self.assertEqual(scoreboard._total_count, 2)
+        self.assertEqual(len(scoreboard._mm_line), 1)
+
+    def test_raising_eq_isolates_poisoned_pair(self):
+        """Test that one raising __eq__ does not discard the rest of a batch."""
+        scoreboard = Scoreboard(name="poison_sb", mode="sync")
+        actuals = [Transaction("A"), Transaction(_ExplodingData()), Transaction(4)]
+        expecteds = [Transaction("A"), Transaction("X"), Transaction(9)]
+        scoreboard._publish_batch(actuals, expecteds)
+        self.assertEqual(scoreboard._total_count, 3)
+        self.assertEqual(scoreboard._match_count, 1)
+        self.assertEqual(len(scoreboard._mm_detail), 2,
+                         "Both the error and the genuine mismatch should be recorded.")
+        self.assertIn("Error", scoreboard._mm_detail[0])
+        self.assertIn("Expected", scoreboard._mm_detail[1])
+
+    def test_ambiguous_eq_result_isolates_poisoned_pair(self):
+        """Test that an __eq__ result with ambiguous truthiness is isolated."""
+        scoreboard = Scoreboard(name="ambiguous_sb", mode="sync")
+        actuals = [Transaction("A"), Transaction(_AmbiguousData()), Transaction(4)]
+        expecteds = [Transaction("A"), Transaction("X"), Transaction(9)]
+        scoreboard._publish_batch(actuals, expecteds)
+        self.assertEqual(scoreboard._total_count, 3)
+        self.assertEqual(scoreboard._match_count, 1)
+        self.assertEqual(len(scoreboard._mm_detail), 2,
+                         "Both the error and the genuine mismatch should be recorded.")
+        self.assertIn("Error", scoreboard._mm_detail[0])
+        self.assertIn("Expected", scoreboard._mm_detail[1])
+
+    def test_sync_mode(self):
+        """Test that sync mode compares inline with no thread or sleeps."""
+        scoreboard = Scoreboard(name="sync_sb", mode="sync")
+        scoreboard.start()  # No-op in sync mode
+        scoreboard.write_actual(Transaction("A"))
+        scoreboard.write_expected(Transaction("A"))
+        scoreboard.write_pair(Transaction("B"), Transaction("C")) # Mismatch
+        scoreboard.flush()
+        scoreboard.stop()  # No-op in sync mode
+        self.assertEqual(scoreboard._total_count, 2)
+        self.assertEqual(len(scoreboard._mm_line), 1)
+        self.assertIsNone(scoreboard._comparison_thread,
+                          "Sync mode should never start a thread.")
+
+    def test_spsc_ring(self):
+        """Test that the lock-free SPSC ring path pairs transactions correctly."""
+        scoreboard = Scoreboard(name="ring_sb", spsc_ring_size=8)
+        scoreboard.start()
+        scoreboard.write_actual(Transaction("A"))
+        scoreboard.write_expected(Transaction("A"))
+        scoreboard.write_actual(Transaction("B"))
+        scoreboard.write_expected(Transaction("C")) # Mismatch
+        time.sleep(0.2)
+        scoreboard.stop()
+        self.assertEqual(scoreboard._total_count, 2)
+        self.assertEqual(len(scoreboard._mm_line), 1)
+
+    def test_spsc_ring_rejects_sharding(self):
+        """Test that the SPSC ring cannot be combined with sharded queues."""
+        with self.assertRaises(ValueError):
+            Scoreboard(name="bad_sb", spsc_ring_size=8, shard_count=2)
+
+    def test_record_history(self):
+        """Test that record_history keeps one outcome byte per comparison."""
+        scoreboard = Scoreboard(name="history_sb", record_history=True)
+        scoreboard.start()
+        scoreboard.write_pair(Transaction("A"), Transaction("A"))
+        scoreboard.write_pair(Transaction("B"), Transaction("C")) # Mismatch
+        time.sleep(0.2)
+        scoreboard.stop()
+        self.assertEqual(scoreboard.match_history, bytearray([1, 0]))
+        self.assertIsNone(self.scoreboard.match_history,
+                          "History should be off by default.")
+
+    def test_capture_lines_disabled(self):
+        """Test that capture_lines=False disables the transaction frame walk."""
+        try:
+            Scoreboard(name="nolines_sb", capture_lines=False)
+            txn = Transaction("A")
+            self.assertIsNone(txn.line, "Line capture should be disabled globally.")
+        finally:
+            Transaction.CAPTURE_LINE = True
+
     def test_invalid_input(self):
-        """Test that writing non-Transaction objects is handled gracefully."""
-        # Suppress console output for this test
-        original_stdout = sys.stdout
-        sys.stdout = io.StringIO()
+        """Test that validate_inputs=True rejects non-Transaction objects."""
+        scoreboard = Scoreboard(name="validated_sb", validate_inputs=True)
+        scoreboard.start()
         try:
-            self.scoreboard.write_actual("not a transaction")
-            self.scoreboard.write_expected("not a transaction")
-            time.sleep(0.2)
+            with self.assertRaises(TypeError):
+                scoreboard.write_actual("not a transaction")
+            with self.assertRaises(TypeError):
+                scoreboard.write_expected("not a transaction")
+            with self.assertRaises(TypeError):
+                scoreboard.write_pair(Transaction("A"), "not a transaction")
             # The queues should be empty as the invalid data is rejected
-            self.assertEqual(self.scoreboard._actual_queue.qsize(), 0)
-            self.assertEqual(self.scoreboard._expected_queue.qsize(), 0)
-            self.assertFalse(self.scoreboard.report()) # No comparisons, so should fail
+            self.assertEqual(sum(len(q) for q in scoreboard._actual_queues), 0)
+            self.assertEqual(sum(len(q) for q in scoreboard._expected_queues), 0)
         finally:
-            sys.stdout = original_stdout
+            scoreboard.stop()
 
 if __name__ == '__main__':
     unittest.main()